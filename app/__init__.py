@@ -1,6 +1,7 @@
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 from dotenv import load_dotenv
 
@@ -15,6 +16,12 @@ def create_app():
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
     app.config['UPLOAD_FOLDER'] = 'uploads'
     
+    # Trust X-Forwarded-For from this many reverse proxies so rate limiting
+    # sees the real client IP instead of the proxy's
+    trusted_proxies = int(os.getenv('TRUSTED_PROXY_COUNT', 0))
+    if trusted_proxies > 0:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=trusted_proxies)
+    
     # Initialize extensions - UPDATED CORS ORIGINS
     CORS(app, resources={
         r"/api/*": {
@@ -56,7 +63,8 @@ def create_app():
                 'available_endpoints': [
                     '/api/campaign/recommendations',
                     '/api/platforms',
-                    '/api/campaign/health'
+                    '/api/campaign/health',
+                    '/api/campaign/metrics'
                 ]
             }
         except Exception as e:
@@ -1,12 +1,43 @@
 from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from app.services.ai_service import ai_service
 from app.utils.validators import validate_campaign_data
+from app.utils.rate_limiter import rate_limiter
+from app.utils.single_flight import SingleFlight
+import hashlib
+import json
+import math
 
 campaign_bp = Blueprint('campaign', __name__)
 
+# Identical in-flight recommendation payloads share one inference run
+recommendation_flight = SingleFlight()
+
+def _client_key():
+    """Rate limit key: JWT identity when a valid token is sent, else client IP"""
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+        if identity:
+            return f"user:{identity}"
+    except (JWTExtendedException, PyJWTError):
+        pass
+    return f"ip:{request.remote_addr}"
+
+def _payload_key(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
 @campaign_bp.route('/campaign/recommendations', methods=['POST'])
 def get_recommendations():
     try:
+        allowed, retry_after = rate_limiter.allow(_client_key())
+        if not allowed:
+            response = jsonify({'error': 'Rate limit exceeded', 'success': False})
+            response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+            return response, 429
+        
         data = request.get_json()
         
         # Validate campaign data
@@ -17,9 +48,12 @@ def get_recommendations():
         print(f"📥 Received campaign data: {data}")
         
         # Get AI recommendations using the trained ML model
-        recommendations = ai_service.get_recommendations(data)
+        recommendations, shared = recommendation_flight.do(
+            _payload_key(data), ai_service.get_recommendations, data
+        )
         
-        print(f"🤖 AI Recommendations generated: {recommendations['recommended_platform']}")
+        print(f"🤖 AI Recommendations generated: {recommendations['recommended_platform']}"
+              f"{' (coalesced)' if shared else ''}")
         
         # Format response to match frontend expectations
         total_budget = data.get('budget', 1000)
@@ -96,7 +130,8 @@ def health_check():
             'available_endpoints': [
                 '/campaign/recommendations',
                 '/platforms',
-                '/campaign/health'
+                '/campaign/health',
+                '/campaign/metrics'
             ]
         })
     except Exception as e:
@@ -105,3 +140,15 @@ def health_check():
             'error': str(e),
             'model_status': 'error'
         }), 500
+
+@campaign_bp.route('/campaign/metrics', methods=['GET'])
+@jwt_required()
+def metrics():
+    """Rate limiting and request coalescing counters"""
+    return jsonify({
+        'success': True,
+        'metrics': {
+            'rate_limiter': rate_limiter.metrics(),
+            'recommendation_coalescing': recommendation_flight.metrics()
+        }
+    })
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Stripe:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = OrderedDict()
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+
+
+class TokenBucketRateLimiter:
+    """In-memory token bucket limiter keyed by client identity.
+
+    Buckets and their counters are spread across a fixed number of lock
+    stripes so concurrent clients rarely contend, and each check is O(1): a
+    dict lookup, a refill computed from elapsed time, and an LRU bump used to
+    cap memory.
+    """
+
+    def __init__(self, capacity=10, refill_rate=1.0, stripes=16, max_clients=10000):
+        capacity = float(capacity)
+        refill_rate = float(refill_rate)
+        if capacity < 1:
+            raise ValueError("Rate limit capacity must be at least 1")
+        if refill_rate <= 0:
+            raise ValueError("Rate limit refill rate must be positive")
+        if stripes < 1 or max_clients < 1:
+            raise ValueError("Stripes and max clients must be at least 1")
+
+        # Never allow more stripes than clients, so the per-stripe cap
+        # multiplied back out cannot exceed max_clients
+        stripes = min(stripes, max_clients)
+
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._max_per_stripe = max_clients // stripes
+
+    def allow(self, key):
+        """Consume one token for key; return (allowed, retry_after_seconds)"""
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        buckets = stripe.buckets
+        now = time.monotonic()
+
+        with stripe.lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = [self.capacity, now]
+                buckets[key] = bucket
+                if len(buckets) > self._max_per_stripe:
+                    buckets.popitem(last=False)
+                    stripe.evicted += 1
+            else:
+                buckets.move_to_end(key)
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                stripe.allowed += 1
+                return True, 0.0
+
+            stripe.rejected += 1
+            return False, (1 - bucket[0]) / self.refill_rate
+
+    def metrics(self):
+        """Snapshot of limiter counters"""
+        totals = {'allowed': 0, 'rejected': 0, 'evicted_clients': 0, 'tracked_clients': 0}
+        for stripe in self._stripes:
+            with stripe.lock:
+                totals['allowed'] += stripe.allowed
+                totals['rejected'] += stripe.rejected
+                totals['evicted_clients'] += stripe.evicted
+                totals['tracked_clients'] += len(stripe.buckets)
+        return {
+            'capacity': self.capacity,
+            'refill_per_second': self.refill_rate,
+            **totals
+        }
+
+
+# Create global instance
+rate_limiter = TokenBucketRateLimiter(
+    capacity=os.getenv('RATE_LIMIT_CAPACITY', 10),
+    refill_rate=os.getenv('RATE_LIMIT_REFILL_PER_SEC', 1)
+)
@@ -0,0 +1,88 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.routes import campaign_routes
+from app.utils.rate_limiter import TokenBucketRateLimiter
+
+CAMPAIGN = {
+    'product_name': 'Widget',
+    'budget': 1000,
+    'objectives': ['leads'],
+    'target_audience': {'age_group': '25-34', 'interests': ['tech']}
+}
+
+RECOMMENDATIONS = {
+    'recommended_platform': 'LinkedIn',
+    'platform_scores': {'LinkedIn': 0.91},
+    'confidence_score': 0.8,
+    'budget_allocation': {'LinkedIn': 1000},
+    'ad_copy_suggestions': [],
+    'optimal_timing': {},
+    'performance_predictions': {
+        'estimated_ctr': 3.5,
+        'estimated_conversions': 0.08,
+        'estimated_reach': 15000
+    }
+}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('JWT_SECRET_KEY', 'test-secret-key-of-at-least-32-bytes')
+    monkeypatch.setattr(campaign_routes, 'rate_limiter', TokenBucketRateLimiter(capacity=2, refill_rate=0.5))
+    monkeypatch.setattr(campaign_routes.ai_service, 'get_recommendations', lambda data: RECOMMENDATIONS)
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_recommendations_rate_limited_with_retry_after(client):
+    for _ in range(2):
+        assert client.post('/api/campaign/recommendations', json=CAMPAIGN).status_code == 200
+
+    response = client.post('/api/campaign/recommendations', json=CAMPAIGN)
+
+    assert response.status_code == 429
+    assert response.get_json()['success'] is False
+    assert response.headers['Retry-After'] == '2'
+
+
+def test_authenticated_users_get_their_own_bucket(app, client):
+    for _ in range(2):
+        client.post('/api/campaign/recommendations', json=CAMPAIGN)
+
+    with app.app_context():
+        token = create_access_token(identity='demo@smartad.com')
+    response = client.post(
+        '/api/campaign/recommendations',
+        json=CAMPAIGN,
+        headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert response.status_code == 200
+
+
+def test_invalid_token_falls_back_to_ip_bucket(client):
+    response = client.post(
+        '/api/campaign/recommendations',
+        json=CAMPAIGN,
+        headers={'Authorization': 'Bearer not-a-token'}
+    )
+
+    assert response.status_code == 200
+
+
+def test_metrics_requires_authentication(app, client):
+    assert client.get('/api/campaign/metrics').status_code == 401
+
+    with app.app_context():
+        token = create_access_token(identity='demo@smartad.com')
+    response = client.get('/api/campaign/metrics', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 200
+    metrics = response.get_json()['metrics']
+    assert set(metrics) == {'rate_limiter', 'recommendation_coalescing'}
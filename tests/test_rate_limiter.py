@@ -0,0 +1,100 @@
+import pytest
+
+from app.utils import rate_limiter as rate_limiter_module
+from app.utils.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_allows_up_to_capacity_then_rejects(clock):
+    limiter = TokenBucketRateLimiter(capacity=3, refill_rate=1)
+
+    assert [limiter.allow('a')[0] for _ in range(3)] == [True, True, True]
+    allowed, retry_after = limiter.allow('a')
+
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+
+def test_retry_after_reflects_partial_refill(clock):
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=2)
+    limiter.allow('a')
+
+    clock[0] += 0.25
+    allowed, retry_after = limiter.allow('a')
+
+    assert not allowed
+    assert retry_after == pytest.approx(0.25)
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    limiter = TokenBucketRateLimiter(capacity=2, refill_rate=1)
+    limiter.allow('a')
+    limiter.allow('a')
+    assert not limiter.allow('a')[0]
+
+    clock[0] += 1
+    assert limiter.allow('a')[0]
+    assert not limiter.allow('a')[0]
+
+    clock[0] += 100
+    assert [limiter.allow('a')[0] for _ in range(3)] == [True, True, False]
+
+
+def test_clients_have_independent_buckets(clock):
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=1)
+
+    assert limiter.allow('a')[0]
+    assert not limiter.allow('a')[0]
+    assert limiter.allow('b')[0]
+
+
+def test_eviction_caps_tracked_clients():
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=1, stripes=4, max_clients=8)
+
+    for i in range(100):
+        limiter.allow(f'client-{i}')
+
+    metrics = limiter.metrics()
+    assert metrics['tracked_clients'] <= 8
+    assert metrics['evicted_clients'] == 100 - metrics['tracked_clients']
+
+
+def test_max_clients_below_stripes_is_not_exceeded():
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=1, stripes=16, max_clients=10)
+
+    for i in range(100):
+        limiter.allow(f'client-{i}')
+
+    assert limiter.metrics()['tracked_clients'] <= 10
+
+
+def test_metrics_sum_counters_across_stripes(clock):
+    limiter = TokenBucketRateLimiter(capacity=1, refill_rate=1)
+
+    for i in range(5):
+        limiter.allow(f'client-{i}')
+        limiter.allow(f'client-{i}')
+
+    metrics = limiter.metrics()
+    assert metrics['allowed'] == 5
+    assert metrics['rejected'] == 5
+    assert metrics['tracked_clients'] == 5
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'capacity': 0.5},
+    {'capacity': 0},
+    {'refill_rate': 0},
+    {'refill_rate': -1},
+    {'max_clients': 0},
+    {'stripes': 0},
+])
+def test_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(**kwargs)
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+def _run_concurrently(flight, fn, callers=5):
+    """Start callers that all call flight.do with the same key"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do('key', fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for_waiters(flight, count):
+    while flight.metrics()['coalesced'] < count:
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_run():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait()
+        return {'value': 42}
+
+    threads, results, errors = _run_concurrently(flight, compute)
+    _wait_for_waiters(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert not errors
+    assert [result for result, _ in results] == [{'value': 42}] * 5
+    assert all(shared for _, shared in results)
+    assert flight.metrics() == {'executed': 1, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_leader_error_reaches_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait()
+        raise RuntimeError('inference failed')
+
+    threads, results, errors = _run_concurrently(flight, compute)
+    _wait_for_waiters(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert not results
+    assert len(errors) == 5
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert flight.metrics()['in_flight'] == 0
+
+
+def test_key_is_released_after_error():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flight.do('key', fail)
+
+    assert flight.metrics()['in_flight'] == 0
+    assert flight.do('key', lambda: 'ok') == ('ok', False)
+
+
+def test_sequential_calls_are_not_cached():
+    flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert flight.do('key', lambda: next(counter)) == (0, False)
+    assert flight.do('key', lambda: next(counter)) == (1, False)
+    assert flight.metrics()['executed'] == 2